@@ -1,26 +1,31 @@
 # OpenClaw Dashboard - Flask Backend
 # Fichier: app.py
 
-from flask import Flask, jsonify, request, send_from_directory
+import time
+
+# Référence pour mesurer le temps de démarrage (avant les imports lourds)
+_PROCESS_START = time.perf_counter()
+
+from flask import Blueprint, Flask, current_app, jsonify, request, send_from_directory
 from flask_cors import CORS
 from flask_socketio import SocketIO, emit
 from flask_sqlalchemy import SQLAlchemy
 from datetime import datetime, timedelta
+from functools import wraps
+from gateway import GatewayClient
+import atexit
 import random
 import threading
-import time
 import os
 
-# Configuration de l'application
-app = Flask(__name__)
-app.config['SECRET_KEY'] = 'openclaw-dashboard-secret-key'
-app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///openclaw.db'
-app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+# Budget de démarrage : le healthcheck docker-compose doit passer en moins d'une seconde
+STARTUP_BUDGET_SECONDS = 1.0
 
-# Initialisation des extensions
-db = SQLAlchemy(app)
-CORS(app, resources={r"/api/*": {"origins": "*"}})
-socketio = SocketIO(app, cors_allowed_origins="*", async_mode='threading')
+# Extensions non liées : elles sont attachées à l'application dans create_app()
+db = SQLAlchemy()
+cors = CORS()
+socketio = SocketIO()
+bp = Blueprint('dashboard', __name__)
 
 # =============================================================================
 # MODÈLES SQLALCHEMY
@@ -136,17 +141,6 @@ MODELS_DATA = [
     {'id': 'gemini-2.5-pro', 'name': 'Gemini 2.5 Pro', 'provider': 'Google', 'cost_per_1k_input': 0.00125, 'cost_per_1k_output': 0.01, 'active': False},
 ]
 
-# Heartbeats simulés
-heartbeat_history = []
-for i in range(24):
-    heartbeat_history.append({
-        'timestamp': (datetime.utcnow() - timedelta(hours=23-i)).isoformat(),
-        'status': 'ok' if random.random() > 0.1 else 'warning',
-        'response_time': random.randint(50, 500)
-    })
-
-# Logs simulés en mémoire
-logs_buffer = []
 log_levels = ['DEBUG', 'INFO', 'WARN', 'ERROR']
 log_sources = ['gateway', 'scheduler', 'api', 'database', 'system']
 log_messages = [
@@ -162,35 +156,165 @@ log_messages = [
     'Configuration reloaded'
 ]
 
-for i in range(100):
-    logs_buffer.append({
-        'id': i + 1,
-        'timestamp': (datetime.utcnow() - timedelta(minutes=random.randint(1, 120))).isoformat(),
-        'level': random.choice(log_levels),
-        'source': random.choice(log_sources),
-        'message': random.choice(log_messages)
-    })
+# =============================================================================
+# INITIALISATION PARESSEUSE DES SOUS-SYSTÈMES
+# =============================================================================
+
+class DashboardState:
+    """État d'exécution d'une instance de l'application.
+
+    Les sous-systèmes coûteux (données simulées, schéma de la base, threads
+    d'arrière-plan) ne sont initialisés qu'à leur première utilisation.
+    """
+
+    def __init__(self):
+        self.start_time = time.time()
+        self.startup_seconds = None
+        self.heartbeat_history = []
+        self.logs_buffer = []
+        self.gateway = None
+        self._ready = set()
+        self._lock = threading.Lock()
+
+    def ensure(self, name, initializer):
+        """Exécute `initializer` une seule fois pour le sous-système `name`"""
+        if name in self._ready:
+            return
+        with self._lock:
+            if name in self._ready:
+                return
+            initializer()
+            self._ready.add(name)
+
+
+def get_state():
+    """Retourne l'état de l'application courante"""
+    return current_app.extensions['openclaw']
+
+
+def _build_simulation_data(state):
+    """Génère l'historique de heartbeats et les logs simulés"""
+    now = datetime.utcnow()
+    for i in range(24):
+        state.heartbeat_history.append({
+            'timestamp': (now - timedelta(hours=23-i)).isoformat(),
+            'status': 'ok' if random.random() > 0.1 else 'warning',
+            'response_time': random.randint(50, 500)
+        })
+
+    for i in range(100):
+        state.logs_buffer.append({
+            'id': i + 1,
+            'timestamp': (now - timedelta(minutes=random.randint(1, 120))).isoformat(),
+            'level': random.choice(log_levels),
+            'source': random.choice(log_sources),
+            'message': random.choice(log_messages)
+        })
+
+
+def ensure_simulation_data():
+    """Initialise les données simulées à la première utilisation"""
+    state = get_state()
+    state.ensure('simulation', lambda: _build_simulation_data(state))
+    return state
+
+
+def ensure_database():
+    """Vérifie le schéma de la base à la première utilisation"""
+    get_state().ensure('database', db.create_all)
+
+
+def ensure_log_generator():
+    """Démarre le thread de génération de logs à la première utilisation"""
+    app = current_app._get_current_object()
+
+    def start():
+        log_thread = threading.Thread(target=generate_random_logs, args=(app,), daemon=True)
+        log_thread.start()
+
+    get_state().ensure('log_generator', start)
+
+
+def ensure_gateway():
+    """Crée le client du Gateway (et son pool de connexions) à la première utilisation"""
+    state = get_state()
+    config = current_app.config
+
+    def connect():
+        state.gateway = GatewayClient(
+            config['GATEWAY_URL'],
+            api_key=config['GATEWAY_API_KEY'],
+            timeout=config['GATEWAY_TIMEOUT'],
+            cache_ttl=config['GATEWAY_CACHE_TTL']
+        )
+        atexit.register(state.gateway.close)
+
+    state.ensure('gateway', connect)
+    return state.gateway
+
+
+def uses_database(view):
+    """Décorateur : garantit que le schéma existe avant d'exécuter la route"""
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        ensure_database()
+        return view(*args, **kwargs)
+    return wrapper
 
 # =============================================================================
 # ROUTES API
 # =============================================================================
 
-@app.route('/api/status')
+@bp.before_app_request
+def stamp_startup_time():
+    """Enregistre le temps de démarrage à la première requête servie.
+
+    Couvre les lanceurs autres que `python app.py` (flask run, gunicorn),
+    pour lesquels le point d'entrée ne l'a pas déjà enregistré.
+    """
+    state = get_state()
+    if state.startup_seconds is not None:
+        return
+    app = current_app._get_current_object()
+
+    def record():
+        if state.startup_seconds is None:
+            record_startup_time(app)
+
+    state.ensure('startup', record)
+
+@bp.route('/api/status')
 def get_status():
-    """Retourne le statut du Gateway OpenClaw"""
-    uptime_seconds = int(time.time() - app_start_time)
+    """Retourne le statut du Gateway OpenClaw et de ses agents"""
+    uptime_seconds = int(time.time() - get_state().start_time)
     hours, remainder = divmod(uptime_seconds, 3600)
     minutes, seconds = divmod(remainder, 60)
     
+    probe = ensure_gateway().get_status(agent['id'] for agent in AGENTS_DATA)
+    gateway = probe['gateway']
+    
     return jsonify({
-        'status': 'online',
-        'version': '1.0.0',
+        'status': gateway['status'],
+        'version': gateway['details'].get('version'),
         'uptime': f"{hours}h {minutes}m {seconds}s",
         'uptime_seconds': uptime_seconds,
+        'latency_ms': gateway['latency_ms'],
+        'agents': {agent_id: agent['status'] for agent_id, agent in probe['agents'].items()},
+        'checked_at': probe['checked_at'],
         'timestamp': datetime.utcnow().isoformat()
     })
 
-@app.route('/api/metrics')
+@bp.route('/api/health')
+def get_health():
+    """Healthcheck léger : ne déclenche aucune initialisation"""
+    state = get_state()
+    return jsonify({
+        'status': 'ok',
+        'startup_seconds': state.startup_seconds,
+        'startup_budget_seconds': current_app.config['STARTUP_BUDGET_SECONDS']
+    })
+
+@bp.route('/api/metrics')
 def get_metrics():
     """Retourne les métriques d'utilisation des tokens"""
     # Simuler des données de métriques pour les 7 derniers jours
@@ -223,13 +347,15 @@ def get_metrics():
         }
     })
 
-@app.route('/api/cron-jobs')
+@bp.route('/api/cron-jobs')
+@uses_database
 def get_cron_jobs():
     """Liste tous les jobs cron"""
     jobs = CronJob.query.all()
     return jsonify([job.to_dict() for job in jobs])
 
-@app.route('/api/cron-jobs/<int:job_id>/run', methods=['POST'])
+@bp.route('/api/cron-jobs/<int:job_id>/run', methods=['POST'])
+@uses_database
 def run_cron_job(job_id):
     """Exécute un job cron manuellement"""
     job = CronJob.query.get_or_404(job_id)
@@ -238,10 +364,15 @@ def run_cron_job(job_id):
     db.session.commit()
     
     # Simuler l'exécution du job (dans un vrai scénario, on lancerait un subprocess)
+    app = current_app._get_current_object()
+    
     def execute_job():
         time.sleep(2)  # Simuler le temps d'exécution
-        job.status = 'idle'
-        db.session.commit()
+        with app.app_context():
+            finished_job = db.session.get(CronJob, job_id)
+            if finished_job:
+                finished_job.status = 'idle'
+                db.session.commit()
         # Émettre un événement WebSocket
         socketio.emit('job_completed', {'job_id': job_id, 'status': 'success'})
     
@@ -252,7 +383,8 @@ def run_cron_job(job_id):
     
     return jsonify({'message': f"Job {job_id} started", 'job': job.to_dict()})
 
-@app.route('/api/cron-jobs/<int:job_id>', methods=['DELETE'])
+@bp.route('/api/cron-jobs/<int:job_id>', methods=['DELETE'])
+@uses_database
 def delete_cron_job(job_id):
     """Supprime un job cron"""
     job = CronJob.query.get_or_404(job_id)
@@ -263,7 +395,8 @@ def delete_cron_job(job_id):
     
     return jsonify({'message': f"Job {job_id} deleted"})
 
-@app.route('/api/cron-jobs/<int:job_id>/toggle', methods=['POST'])
+@bp.route('/api/cron-jobs/<int:job_id>/toggle', methods=['POST'])
+@uses_database
 def toggle_cron_job(job_id):
     """Active ou désactive un job cron"""
     job = CronJob.query.get_or_404(job_id)
@@ -275,17 +408,21 @@ def toggle_cron_job(job_id):
     
     return jsonify({'message': f"Job {job_id} {status}", 'job': job.to_dict()})
 
-@app.route('/api/agents')
+@bp.route('/api/agents')
 def get_agents():
     """Liste tous les agents et leurs relations"""
-    return jsonify(AGENTS_DATA)
+    probe = ensure_gateway().get_status(agent['id'] for agent in AGENTS_DATA)
+    return jsonify([
+        {**agent, 'status': probe['agents'][agent['id']]['status']}
+        for agent in AGENTS_DATA
+    ])
 
-@app.route('/api/skills')
+@bp.route('/api/skills')
 def get_skills():
     """Liste tous les skills installés"""
     return jsonify(SKILLS_DATA)
 
-@app.route('/api/skills/<skill_id>/toggle', methods=['POST'])
+@bp.route('/api/skills/<skill_id>/toggle', methods=['POST'])
 def toggle_skill(skill_id):
     """Active ou désactive un skill"""
     skill = next((s for s in SKILLS_DATA if s['id'] == skill_id), None)
@@ -296,12 +433,12 @@ def toggle_skill(skill_id):
         return jsonify(skill)
     return jsonify({'error': 'Skill not found'}), 404
 
-@app.route('/api/models')
+@bp.route('/api/models')
 def get_models():
     """Liste tous les modèles disponibles avec leurs coûts"""
     return jsonify(MODELS_DATA)
 
-@app.route('/api/models/<model_id>/activate', methods=['POST'])
+@bp.route('/api/models/<model_id>/activate', methods=['POST'])
 def activate_model(model_id):
     """Active un modèle"""
     for model in MODELS_DATA:
@@ -312,11 +449,12 @@ def activate_model(model_id):
     
     return jsonify({'message': f"Model {model_id} activated", 'models': MODELS_DATA})
 
-@app.route('/api/heartbeat')
+@bp.route('/api/heartbeat')
 def get_heartbeat():
     """Retourne l'historique des heartbeats"""
+    state = ensure_simulation_data()
     return jsonify({
-        'history': heartbeat_history,
+        'history': state.heartbeat_history,
         'current': {
             'status': 'ok',
             'response_time': random.randint(50, 200),
@@ -324,14 +462,15 @@ def get_heartbeat():
         }
     })
 
-@app.route('/api/logs')
+@bp.route('/api/logs')
 def get_logs():
     """Retourne les logs récents"""
     limit = request.args.get('limit', 50, type=int)
     level = request.args.get('level', None)
     source = request.args.get('source', None)
     
-    filtered_logs = logs_buffer
+    ensure_log_generator()
+    filtered_logs = ensure_simulation_data().logs_buffer
     
     if level:
         filtered_logs = [log for log in filtered_logs if log['level'] == level.upper()]
@@ -343,24 +482,41 @@ def get_logs():
     
     return jsonify(filtered_logs[:limit])
 
-@app.route('/api/actions/restart', methods=['POST'])
+@bp.route('/api/actions/restart', methods=['POST'])
 def restart_gateway():
     """Redémarre le Gateway OpenClaw"""
     add_log('WARN', 'system', 'Gateway restart requested')
     
-    # Dans un vrai scénario, on redémarrerait le service
-    def restart():
-        time.sleep(2)
-        add_log('INFO', 'system', 'Gateway restarted successfully')
-        socketio.emit('gateway_restarted', {'timestamp': datetime.utcnow().isoformat()})
-    
-    threading.Thread(target=restart).start()
-    
-    return jsonify({'message': 'Gateway restart initiated'})
-
-@app.route('/api/actions/clear-cache', methods=['POST'])
+    app = current_app._get_current_object()
+    
+    def on_complete(operation):
+        # Notifier d'abord : un échec d'écriture du log ne doit pas bloquer l'événement
+        socketio.emit('gateway_restarted', {**operation, 'timestamp': operation['completed_at']})
+        with app.app_context():
+            try:
+                if operation['status'] == 'succeeded':
+                    add_log('INFO', 'system', 'Gateway restarted successfully')
+                else:
+                    add_log('ERROR', 'system', f"Gateway restart failed: {operation['error']}")
+            except Exception:
+                current_app.logger.exception("Impossible d'enregistrer la fin du redémarrage")
+    
+    operation = ensure_gateway().restart(on_complete=on_complete)
+    
+    return jsonify({'message': 'Gateway restart initiated', 'operation': operation}), 202
+
+@bp.route('/api/actions/restart/<operation_id>')
+def get_restart_operation(operation_id):
+    """Retourne l'état d'une opération de redémarrage"""
+    operation = ensure_gateway().get_restart(operation_id)
+    if operation:
+        return jsonify(operation)
+    return jsonify({'error': 'Restart operation not found'}), 404
+
+@bp.route('/api/actions/clear-cache', methods=['POST'])
 def clear_cache():
     """Vide le cache"""
+    ensure_gateway().invalidate()
     add_log('INFO', 'system', 'Cache cleared')
     return jsonify({'message': 'Cache cleared successfully'})
 
@@ -368,13 +524,15 @@ def clear_cache():
 # ROUTES POUR LE KANBAN
 # =============================================================================
 
-@app.route('/api/tasks')
+@bp.route('/api/tasks')
+@uses_database
 def get_tasks():
     """Liste toutes les tâches"""
     tasks = Task.query.all()
     return jsonify([task.to_dict() for task in tasks])
 
-@app.route('/api/tasks', methods=['POST'])
+@bp.route('/api/tasks', methods=['POST'])
+@uses_database
 def create_task():
     """Crée une nouvelle tâche"""
     data = request.json
@@ -393,7 +551,8 @@ def create_task():
     
     return jsonify(task.to_dict()), 201
 
-@app.route('/api/tasks/<int:task_id>', methods=['PUT'])
+@bp.route('/api/tasks/<int:task_id>', methods=['PUT'])
+@uses_database
 def update_task(task_id):
     """Met à jour une tâche"""
     task = Task.query.get_or_404(task_id)
@@ -413,7 +572,8 @@ def update_task(task_id):
     
     return jsonify(task.to_dict())
 
-@app.route('/api/tasks/<int:task_id>', methods=['DELETE'])
+@bp.route('/api/tasks/<int:task_id>', methods=['DELETE'])
+@uses_database
 def delete_task(task_id):
     """Supprime une tâche"""
     task = Task.query.get_or_404(task_id)
@@ -433,6 +593,7 @@ def delete_task(task_id):
 def handle_connect():
     """Gestion de la connexion WebSocket"""
     print(f"Client connected: {request.sid}")
+    ensure_log_generator()
     emit('connected', {'message': 'Connected to OpenClaw Dashboard'})
 
 @socketio.on('disconnect')
@@ -446,6 +607,7 @@ def handle_disconnect():
 
 def add_log(level, source, message):
     """Ajoute un log au buffer et à la base de données"""
+    logs_buffer = ensure_simulation_data().logs_buffer
     log_entry = {
         'id': len(logs_buffer) + 1,
         'timestamp': datetime.utcnow().isoformat(),
@@ -463,56 +625,56 @@ def add_log(level, source, message):
     socketio.emit('new_log', log_entry)
     
     # Sauvegarder en base de données
+    ensure_database()
     db_log = LogEntry(level=level, source=source, message=message)
     db.session.add(db_log)
     db.session.commit()
 
-def generate_random_logs():
+def generate_random_logs(app):
     """Génère des logs aléatoires périodiquement"""
     while True:
         time.sleep(random.randint(5, 15))
         level = random.choice(log_levels)
         source = random.choice(log_sources)
         message = random.choice(log_messages)
-        add_log(level, source, message)
-
-def init_database():
-    """Initialise la base de données avec des données de test"""
-    with app.app_context():
-        db.create_all()
-        
-        # Ajouter des tâches de test si la base est vide
-        if Task.query.count() == 0:
-            test_tasks = [
-                Task(title='Configurer OpenClaw', description='Installation et configuration initiale', status='done', priority='high'),
-                Task(title='Intégrer Gmail', description='Connecter le skill Gmail', status='in_progress', priority='medium'),
-                Task(title='Créer dashboard', description='Développer le dashboard web', status='in_progress', priority='high'),
-                Task(title='Ajouter WebSocket', description='Implémenter les logs temps réel', status='todo', priority='medium'),
-                Task(title='Documentation', description='Rédiger la documentation', status='todo', priority='low'),
-            ]
-            for task in test_tasks:
-                db.session.add(task)
-        
-        # Ajouter des jobs cron de test si la base est vide
-        if CronJob.query.count() == 0:
-            test_jobs = [
-                CronJob(name='Morning Check', schedule='0 8 * * *', command='openclaw heartbeat', is_active=True),
-                CronJob(name='Daily Backup', schedule='0 2 * * *', command='openclaw backup', is_active=True),
-                CronJob(name='Weekly Report', schedule='0 9 * * 1', command='openclaw report weekly', is_active=False),
-                CronJob(name='Cleanup Logs', schedule='0 3 * * 0', command='openclaw logs cleanup', is_active=True),
-            ]
-            for job in test_jobs:
-                db.session.add(job)
-        
-        db.session.commit()
-        print("Base de données initialisée")
+        with app.app_context():
+            add_log(level, source, message)
+
+def seed_database():
+    """Crée le schéma et ajoute des données de test si la base est vide"""
+    db.create_all()
+    
+    # Ajouter des tâches de test si la base est vide
+    if Task.query.count() == 0:
+        test_tasks = [
+            Task(title='Configurer OpenClaw', description='Installation et configuration initiale', status='done', priority='high'),
+            Task(title='Intégrer Gmail', description='Connecter le skill Gmail', status='in_progress', priority='medium'),
+            Task(title='Créer dashboard', description='Développer le dashboard web', status='in_progress', priority='high'),
+            Task(title='Ajouter WebSocket', description='Implémenter les logs temps réel', status='todo', priority='medium'),
+            Task(title='Documentation', description='Rédiger la documentation', status='todo', priority='low'),
+        ]
+        for task in test_tasks:
+            db.session.add(task)
+    
+    # Ajouter des jobs cron de test si la base est vide
+    if CronJob.query.count() == 0:
+        test_jobs = [
+            CronJob(name='Morning Check', schedule='0 8 * * *', command='openclaw heartbeat', is_active=True),
+            CronJob(name='Daily Backup', schedule='0 2 * * *', command='openclaw backup', is_active=True),
+            CronJob(name='Weekly Report', schedule='0 9 * * 1', command='openclaw report weekly', is_active=False),
+            CronJob(name='Cleanup Logs', schedule='0 3 * * 0', command='openclaw logs cleanup', is_active=True),
+        ]
+        for job in test_jobs:
+            db.session.add(job)
+    
+    db.session.commit()
 
 # =============================================================================
 # STATIC FILES SERVING (Frontend React)
 # =============================================================================
 
-@app.route('/', defaults={'path': ''})
-@app.route('/<path:path>')
+@bp.route('/', defaults={'path': ''})
+@bp.route('/<path:path>')
 def serve_frontend(path):
     """Sert les fichiers statiques du frontend React"""
     frontend_path = os.path.join(os.path.dirname(__file__), 'frontend', 'dist')
@@ -525,22 +687,89 @@ def serve_frontend(path):
     else:
         return jsonify({'error': 'Frontend not built. Run: cd frontend && npm run build'}), 503
 
+# =============================================================================
+# APPLICATION FACTORY
+# =============================================================================
+
+def create_app(config=None):
+    """Crée et configure une instance de l'application.
+
+    Aucune requête SQL ni génération de données n'a lieu ici : les
+    sous-systèmes sont initialisés à leur première utilisation (voir
+    DashboardState). Le seeding passe par la commande `flask seed`.
+    """
+    app = Flask(__name__)
+    app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY', 'openclaw-dashboard-secret-key')
+    app.config['SQLALCHEMY_DATABASE_URI'] = os.environ.get('DATABASE_URL', 'sqlite:///openclaw.db')
+    app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+    app.config['STARTUP_BUDGET_SECONDS'] = float(os.environ.get('STARTUP_BUDGET_SECONDS', STARTUP_BUDGET_SECONDS))
+    app.config['GATEWAY_URL'] = os.environ.get('GATEWAY_URL', 'http://localhost:8080')
+    app.config['GATEWAY_API_KEY'] = os.environ.get('GATEWAY_API_KEY') or None
+    app.config['GATEWAY_TIMEOUT'] = float(os.environ.get('GATEWAY_TIMEOUT', 2.0))
+    app.config['GATEWAY_CACHE_TTL'] = float(os.environ.get('GATEWAY_CACHE_TTL', 2.0))
+    if config:
+        app.config.update(config)
+
+    # Initialisation des extensions
+    db.init_app(app)
+    cors.init_app(app, resources={r"/api/*": {"origins": "*"}})
+    socketio.init_app(app, cors_allowed_origins="*", async_mode='threading')
+
+    app.extensions['openclaw'] = DashboardState()
+    app.register_blueprint(bp)
+
+    @app.cli.command('seed')
+    def seed_command():
+        """Crée le schéma et insère les données de démonstration."""
+        seed_database()
+        print("Base de données initialisée")
+
+    return app
+
+
+def process_uptime():
+    """Secondes écoulées depuis le lancement du processus.
+
+    Sous Linux, /proc inclut le démarrage de l'interpréteur ; ailleurs, la
+    mesure part du début de l'import de ce module.
+    """
+    try:
+        with open('/proc/self/stat') as stat_file:
+            start_ticks = int(stat_file.read().rsplit(')', 1)[1].split()[19])
+        with open('/proc/uptime') as uptime_file:
+            system_uptime = float(uptime_file.read().split()[0])
+        return system_uptime - start_ticks / os.sysconf('SC_CLK_TCK')
+    except (OSError, ValueError, IndexError, AttributeError):
+        return time.perf_counter() - _PROCESS_START
+
+
+def record_startup_time(app):
+    """Enregistre le temps de démarrage et avertit si le budget est dépassé.
+
+    À appeler juste avant que le serveur n'accepte les connexions.
+    """
+    state = app.extensions['openclaw']
+    state.startup_seconds = round(process_uptime(), 3)
+    budget = app.config['STARTUP_BUDGET_SECONDS']
+    if state.startup_seconds > budget:
+        app.logger.warning(
+            "Démarrage en %.3fs, au-delà du budget de %.1fs", state.startup_seconds, budget
+        )
+    return state.startup_seconds
+
 # =============================================================================
 # POINT D'ENTRÉE
 # =============================================================================
 
 if __name__ == '__main__':
-    app_start_time = time.time()
-    
-    # Initialiser la base de données
-    init_database()
-    
-    # Démarrer le thread de génération de logs
-    log_thread = threading.Thread(target=generate_random_logs, daemon=True)
-    log_thread.start()
+    app = create_app()
     
     print("🚀 OpenClaw Dashboard démarré sur http://localhost:5000")
     print("📊 API: http://localhost:5000/api")
     
+    # Mesuré juste avant l'ouverture du port
+    startup_seconds = record_startup_time(app)
+    print(f"⏱️  Prêt en {startup_seconds:.3f}s (budget {app.config['STARTUP_BUDGET_SECONDS']:g}s)")
+    
     # Mode production : pas de debug
     socketio.run(app, host='0.0.0.0', port=5000, debug=False, allow_unsafe_werkzeug=True)
@@ -0,0 +1,4 @@
+"""Gateway client module for OpenClaw Dashboard."""
+from .client import GatewayClient
+
+__all__ = ['GatewayClient']
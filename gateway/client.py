@@ -0,0 +1,233 @@
+"""
+Client du Gateway OpenClaw
+Fichier: gateway/client.py
+
+Sondes du Gateway et des agents via un pool de connexions persistant,
+avec un cache à TTL court et la fusion des requêtes concurrentes : N
+dashboards qui interrogent /api/status ne déclenchent qu'une seule sonde.
+"""
+
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
+import threading
+import time
+import uuid
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Endpoints exposés par le Gateway OpenClaw
+GATEWAY_STATUS_PATH = '/api/status'
+AGENT_STATUS_PATH = '/api/agents/{agent_id}/status'
+GATEWAY_RESTART_PATH = '/api/restart'
+
+# Nombre d'opérations de redémarrage conservées en mémoire
+MAX_RESTART_OPERATIONS = 50
+
+
+class GatewayClient:
+    """Client HTTP du Gateway OpenClaw"""
+
+    def __init__(self, base_url, api_key=None, timeout=2.0, cache_ttl=2.0,
+                 pool_size=10, restart_timeout=30.0, poll_interval=0.5):
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+        self.cache_ttl = cache_ttl
+        self.restart_timeout = restart_timeout
+        self.poll_interval = poll_interval
+
+        # Pool de connexions persistant (keep-alive) partagé par toutes les sondes
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        if api_key:
+            self.session.headers['Authorization'] = f'Bearer {api_key}'
+
+        self._executor = ThreadPoolExecutor(max_workers=pool_size, thread_name_prefix='gateway')
+        self._lock = threading.Lock()
+        self._cache = {}
+        self._inflight = {}
+        self._restarts = OrderedDict()
+        self._closed = threading.Event()
+
+    # -------------------------------------------------------------------------
+    # Sondes
+    # -------------------------------------------------------------------------
+
+    def _probe(self, path):
+        """Sonde un endpoint et retourne son accessibilité et sa latence.
+
+        `status` vaut 'online' pour une réponse 2xx, 'offline' sinon ; la
+        réponse du Gateway est conservée telle quelle sous `details`.
+        """
+        started = time.perf_counter()
+        try:
+            response = self.session.get(f'{self.base_url}{path}', timeout=self.timeout)
+            latency_ms = round((time.perf_counter() - started) * 1000, 1)
+            response.raise_for_status()
+        except requests.RequestException as exc:
+            return {'status': 'offline', 'latency_ms': None, 'details': {}, 'error': str(exc)}
+
+        try:
+            payload = response.json()
+        except ValueError:
+            payload = {}
+        if not isinstance(payload, dict):
+            payload = {}
+        return {'status': 'online', 'latency_ms': latency_ms, 'details': payload, 'error': None}
+
+    def _probe_all(self, agent_ids):
+        """Sonde le Gateway et chaque agent en parallèle"""
+        gateway = self._executor.submit(self._probe, GATEWAY_STATUS_PATH)
+        agents = {
+            agent_id: self._executor.submit(self._probe, AGENT_STATUS_PATH.format(agent_id=agent_id))
+            for agent_id in agent_ids
+        }
+        return {
+            'gateway': gateway.result(),
+            'agents': {agent_id: future.result() for agent_id, future in agents.items()},
+            'checked_at': datetime.utcnow().isoformat()
+        }
+
+    def get_status(self, agent_ids=()):
+        """Retourne le statut du Gateway et des agents (mis en cache)"""
+        agent_ids = tuple(agent_ids)
+        return self._cached(('status', agent_ids), lambda: self._probe_all(agent_ids))
+
+    def _cached(self, key, fetch):
+        """Sert `key` depuis le cache ou fusionne les appels concurrents en un seul"""
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry and entry[0] > time.monotonic():
+                return entry[1]
+            future = self._inflight.get(key)
+            is_owner = future is None
+            if is_owner:
+                future = Future()
+                self._inflight[key] = future
+
+        if not is_owner:
+            return future.result()
+
+        try:
+            value = fetch()
+        except Exception as exc:
+            with self._lock:
+                self._inflight.pop(key, None)
+            future.set_exception(exc)
+            raise
+
+        with self._lock:
+            self._cache[key] = (time.monotonic() + self.cache_ttl, value)
+            self._inflight.pop(key, None)
+        future.set_result(value)
+        return value
+
+    def invalidate(self):
+        """Vide le cache des sondes"""
+        with self._lock:
+            self._cache.clear()
+
+    # -------------------------------------------------------------------------
+    # Redémarrage
+    # -------------------------------------------------------------------------
+
+    def restart(self, on_complete=None):
+        """Lance un redémarrage du Gateway et retourne l'opération associée.
+
+        Si un redémarrage est déjà en cours, l'opération existante est
+        retournée. `on_complete` est appelé avec l'opération terminée.
+        """
+        with self._lock:
+            for operation in self._restarts.values():
+                if operation['status'] in ('pending', 'running'):
+                    return dict(operation)
+
+            operation = {
+                'id': uuid.uuid4().hex,
+                'status': 'pending',
+                'requested_at': datetime.utcnow().isoformat(),
+                'completed_at': None,
+                'error': None
+            }
+            self._restarts[operation['id']] = operation
+            while len(self._restarts) > MAX_RESTART_OPERATIONS:
+                self._restarts.popitem(last=False)
+            snapshot = dict(operation)
+
+        # Thread daemon : un redémarrage en cours ne bloque pas l'arrêt de l'interpréteur
+        threading.Thread(
+            target=self._run_restart, args=(operation['id'], on_complete),
+            name='gateway-restart', daemon=True
+        ).start()
+        return snapshot
+
+    def get_restart(self, operation_id):
+        """Retourne une opération de redémarrage, ou None si inconnue"""
+        with self._lock:
+            operation = self._restarts.get(operation_id)
+            return dict(operation) if operation else None
+
+    def _update_restart(self, operation_id, **fields):
+        with self._lock:
+            self._restarts[operation_id].update(fields)
+            return dict(self._restarts[operation_id])
+
+    @staticmethod
+    def _has_restarted(before, probe):
+        """Indique si `probe` provient d'une autre instance du Gateway que `before`"""
+        before, probe = before['details'], probe['details']
+        if before.get('started_at') and probe.get('started_at'):
+            return probe['started_at'] != before['started_at']
+        if before.get('uptime_seconds') is not None and probe.get('uptime_seconds') is not None:
+            return probe['uptime_seconds'] < before['uptime_seconds']
+        return False
+
+    def _run_restart(self, operation_id, on_complete):
+        """Demande le redémarrage puis attend que le Gateway ait réellement redémarré.
+
+        Le redémarrage n'est considéré comme terminé qu'une fois le Gateway
+        de nouveau en ligne après avoir été vu hors ligne, ou après un
+        changement de `started_at` / une baisse de `uptime_seconds`.
+        """
+        self._update_restart(operation_id, status='running')
+        error = None
+        try:
+            before = self._probe(GATEWAY_STATUS_PATH)
+            response = self.session.post(f'{self.base_url}{GATEWAY_RESTART_PATH}', timeout=self.timeout)
+            response.raise_for_status()
+
+            deadline = time.monotonic() + self.restart_timeout
+            went_down = False
+            while True:
+                if self._closed.wait(self.poll_interval):
+                    error = 'Gateway client closed'
+                    break
+                probe = self._probe(GATEWAY_STATUS_PATH)
+                if probe['status'] != 'online':
+                    went_down = True
+                elif went_down or self._has_restarted(before, probe):
+                    break
+                if time.monotonic() > deadline:
+                    error = f'Gateway restart not observed after {self.restart_timeout:g}s'
+                    break
+        except requests.RequestException as exc:
+            error = str(exc)
+
+        self.invalidate()
+        operation = self._update_restart(
+            operation_id,
+            status='failed' if error else 'succeeded',
+            completed_at=datetime.utcnow().isoformat(),
+            error=error
+        )
+        if on_complete:
+            on_complete(operation)
+
+    def close(self):
+        """Libère le pool de connexions et les threads"""
+        self._closed.set()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self.session.close()
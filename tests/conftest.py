@@ -0,0 +1,90 @@
+"""
+Fixtures pytest partagées
+Fichier: tests/conftest.py
+"""
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import threading
+import time
+
+import pytest
+
+
+class StubGateway:
+    """Gateway OpenClaw minimal servi en local pour les tests.
+
+    `restart_mode` contrôle la réponse à POST /api/restart :
+    - 'restart' : le Gateway est hors ligne pendant `downtime` puis revient
+      avec un nouveau `started_at`
+    - 'ignore'  : la requête est acceptée mais rien ne redémarre
+    - 'error'   : la requête échoue avec un code 500
+
+    `status_field`, s'il est défini, est renvoyé comme champ `status` propre
+    au Gateway dans ses réponses.
+    """
+
+    def __init__(self, delay=0.0, restart_mode='restart', downtime=0.2, status_field=None):
+        self.delay = delay
+        self.status_field = status_field
+        self.restart_mode = restart_mode
+        self.downtime = downtime
+        self.started_at = time.time()
+        self.down_until = 0.0
+        self.hits = 0
+        self._lock = threading.Lock()
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), self._handler())
+        self.url = f'http://127.0.0.1:{self.server.server_port}'
+
+    def _handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def log_message(self, *args):
+                pass
+
+            def _send(self, code, payload=None):
+                body = json.dumps(payload).encode() if payload is not None else b''
+                self.send_response(code)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self):
+                with stub._lock:
+                    stub.hits += 1
+                time.sleep(stub.delay)
+                if time.time() < stub.down_until:
+                    return self._send(503, {'status': 'offline'})
+                payload = {'status': stub.status_field} if stub.status_field else {}
+                if self.path == '/api/status':
+                    payload.update({'version': '2.0.0', 'started_at': stub.started_at})
+                return self._send(200, payload)
+
+            def do_POST(self):
+                if self.path != '/api/restart' or stub.restart_mode == 'error':
+                    return self._send(500, {'error': 'restart failed'})
+                if stub.restart_mode == 'restart':
+                    stub.down_until = time.time() + stub.downtime
+                    stub.started_at = stub.down_until
+                return self._send(202, {'message': 'restarting'})
+
+        return Handler
+
+    def start(self):
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def stub_gateway():
+    gateway = StubGateway().start()
+    yield gateway
+    gateway.stop()
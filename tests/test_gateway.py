@@ -0,0 +1,129 @@
+"""
+Tests du client Gateway contre un Gateway stub local
+Fichier: tests/test_gateway.py
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import time
+
+import pytest
+
+from gateway import GatewayClient
+
+AGENT_IDS = ('agent-1', 'agent-2', 'agent-3')
+
+
+@pytest.fixture
+def client(stub_gateway):
+    gateway_client = GatewayClient(
+        stub_gateway.url, cache_ttl=0.5, restart_timeout=1.0, poll_interval=0.05
+    )
+    yield gateway_client
+    gateway_client.close()
+
+
+def wait_for_restart(client, operation_id, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        operation = client.get_restart(operation_id)
+        if operation['status'] not in ('pending', 'running'):
+            return operation
+        time.sleep(0.02)
+    raise AssertionError('restart operation did not complete')
+
+
+def test_concurrent_status_calls_share_one_probe(stub_gateway, client):
+    stub_gateway.delay = 0.2
+
+    with ThreadPoolExecutor(max_workers=20) as pool:
+        results = list(pool.map(lambda _: client.get_status(AGENT_IDS), range(20)))
+
+    # Une seule tournée : le Gateway plus chaque agent
+    assert stub_gateway.hits == 1 + len(AGENT_IDS)
+    assert all(result is results[0] for result in results)
+    assert results[0]['gateway']['status'] == 'online'
+    assert set(results[0]['agents']) == set(AGENT_IDS)
+
+
+def test_status_is_cached_within_ttl(stub_gateway, client):
+    first = client.get_status(AGENT_IDS)
+    hits = stub_gateway.hits
+
+    assert client.get_status(AGENT_IDS) is first
+    assert stub_gateway.hits == hits
+
+    time.sleep(client.cache_ttl + 0.1)
+    assert client.get_status(AGENT_IDS) is not first
+    assert stub_gateway.hits == 2 * hits
+
+
+def test_gateway_status_field_does_not_override_reachability(stub_gateway, client):
+    stub_gateway.status_field = 'ok'
+
+    status = client.get_status(AGENT_IDS)
+
+    assert status['gateway']['status'] == 'online'
+    assert status['gateway']['details']['status'] == 'ok'
+    assert status['gateway']['details']['version'] == '2.0.0'
+    assert all(agent['status'] == 'online' for agent in status['agents'].values())
+
+
+def test_offline_gateway_is_reported():
+    offline_client = GatewayClient('http://127.0.0.1:1', timeout=0.5)
+    try:
+        status = offline_client.get_status(AGENT_IDS)
+    finally:
+        offline_client.close()
+
+    assert status['gateway']['status'] == 'offline'
+    assert all(agent['status'] == 'offline' for agent in status['agents'].values())
+
+
+def test_restart_succeeds_once_gateway_has_restarted(client):
+    completed = threading.Event()
+    operation = client.restart(on_complete=lambda op: completed.set())
+
+    assert operation['status'] == 'pending'
+    # Un second appel pendant le redémarrage réutilise l'opération en cours
+    assert client.restart()['id'] == operation['id']
+
+    finished = wait_for_restart(client, operation['id'])
+    assert finished['status'] == 'succeeded'
+    assert finished['error'] is None
+    assert finished['completed_at'] is not None
+    assert completed.wait(1.0)
+
+
+def test_restart_detected_from_started_at_without_downtime(stub_gateway, client):
+    stub_gateway.status_field = 'ok'
+    stub_gateway.downtime = 0.0
+
+    operation = client.restart()
+    finished = wait_for_restart(client, operation['id'])
+
+    assert finished['status'] == 'succeeded'
+
+
+def test_restart_fails_when_gateway_never_restarts(stub_gateway, client):
+    stub_gateway.restart_mode = 'ignore'
+
+    operation = client.restart()
+    finished = wait_for_restart(client, operation['id'])
+
+    assert finished['status'] == 'failed'
+    assert 'not observed' in finished['error']
+
+
+def test_restart_fails_when_gateway_rejects_request(stub_gateway, client):
+    stub_gateway.restart_mode = 'error'
+
+    operation = client.restart()
+    finished = wait_for_restart(client, operation['id'])
+
+    assert finished['status'] == 'failed'
+    assert '500' in finished['error']
+
+
+def test_unknown_restart_operation(client):
+    assert client.get_restart('unknown') is None
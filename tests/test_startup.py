@@ -0,0 +1,63 @@
+"""
+Tests du démarrage de l'application
+Fichier: tests/test_startup.py
+"""
+
+import json
+import os
+import subprocess
+import sys
+import time
+
+import app as dashboard
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+COLD_BOOT_SCRIPT = """
+import json
+import app
+response = app.create_app().test_client().get('/api/health')
+print(json.dumps(response.json))
+"""
+
+
+def test_cold_boot_first_health_within_budget(tmp_path):
+    # Interpréteur neuf : le temps mesuré inclut son démarrage et les imports
+    env = {**os.environ, 'DATABASE_URL': f'sqlite:///{tmp_path}/startup.db'}
+    result = subprocess.run(
+        [sys.executable, '-c', COLD_BOOT_SCRIPT],
+        cwd=REPO_ROOT, env=env, capture_output=True, text=True, timeout=30, check=True
+    )
+    health = json.loads(result.stdout.strip().splitlines()[-1])
+
+    assert health['status'] == 'ok'
+    assert health['startup_seconds'] < health['startup_budget_seconds']
+
+
+def test_startup_initializes_no_subsystem(tmp_path):
+    app = dashboard.create_app({'SQLALCHEMY_DATABASE_URI': f'sqlite:///{tmp_path}/startup.db'})
+    app.test_client().get('/api/health')
+
+    state = app.extensions['openclaw']
+    assert state.heartbeat_history == []
+    assert state.logs_buffer == []
+    assert state.gateway is None
+    assert not (tmp_path / 'startup.db').exists()
+
+
+def test_record_startup_time_covers_process_lifetime(tmp_path):
+    app = dashboard.create_app({'SQLALCHEMY_DATABASE_URI': f'sqlite:///{tmp_path}/startup.db'})
+    startup_seconds = dashboard.record_startup_time(app)
+
+    assert startup_seconds >= time.perf_counter() - dashboard._PROCESS_START - 0.05
+    assert app.test_client().get('/api/health').json['startup_seconds'] == startup_seconds
+
+
+def test_first_request_records_startup_time_without_entry_point(tmp_path):
+    app = dashboard.create_app({'SQLALCHEMY_DATABASE_URI': f'sqlite:///{tmp_path}/startup.db'})
+    assert app.extensions['openclaw'].startup_seconds is None
+
+    startup_seconds = app.test_client().get('/api/health').json['startup_seconds']
+
+    assert startup_seconds is not None
+    assert app.test_client().get('/api/health').json['startup_seconds'] == startup_seconds